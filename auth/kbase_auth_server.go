@@ -168,6 +168,9 @@ func (server *KBaseAuthServer) getUserInfo() (kbaseAuthUserInfo, error) {
 	if err != nil {
 		return userInfo, err
 	}
+	// closing the body returns the connection to the transport's keep-alive
+	// pool so later requests can reuse it
+	defer resp.Body.Close()
 	if resp.StatusCode != 200 {
 		err = kbaseAuthError(resp)
 		if err != nil {